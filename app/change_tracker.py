@@ -1,6 +1,10 @@
 """Change tracking module for IEEE Paper Formatter"""
 from app.models import Fix, Section, ParsedDocument, FormattedDocument
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Optional, Union
+
+# Lightweight "before" snapshot: (id, type, original_heading, content) per section
+# Much cheaper to create than a deep copy of the whole ParsedDocument
+DocumentSnapshot = Tuple[Tuple[str, Any, Optional[str], str], ...]
 
 
 class ChangeTracker:
@@ -8,22 +12,51 @@ class ChangeTracker:
     Tracks all changes made during formatting process
     Records original values, formatted values, and reasons for changes
     """
-    
+
     def __init__(self):
         """Initialize change tracker"""
         self.fixes: List[Fix] = []
-    
+
+    @staticmethod
+    def snapshot(document: ParsedDocument) -> DocumentSnapshot:
+        """
+        Capture only the fields change tracking compares
+        Cheaper alternative to document.model_copy(deep=True) for "before" state
+        """
+        return tuple(
+            (s.id, s.type, s.original_heading, s.content)
+            for s in document.sections
+        )
+
     def track_changes(
         self,
-        document_before: ParsedDocument,
+        document_before: Union[ParsedDocument, DocumentSnapshot],
         document_after: FormattedDocument
     ) -> List[Fix]:
         """
         Track all changes between original and formatted documents
+        Accepts either a full ParsedDocument or a snapshot() of one
         Returns list of Fix objects documenting each change
-        
+
         Requirements: 12.3
         """
+        if not isinstance(document_before, ParsedDocument):
+            # Rebuild lightweight sections from a snapshot
+            # (fields not captured keep their defaults, matching a freshly
+            # parsed document before formatting)
+            document_before = ParsedDocument.model_construct(
+                sections=[
+                    Section.model_construct(
+                        id=sec_id,
+                        type=sec_type,
+                        original_heading=heading,
+                        content=content
+                    )
+                    for sec_id, sec_type, heading, content in document_before
+                ],
+                metadata={}
+            )
+
         self.fixes = []
         
         # Create mappings for easier comparison
@@ -68,8 +68,80 @@ Original text:
 {text}
 
 Return ONLY the corrected text with no explanations."""
-        
+
         return prompt
+
+    # Separates segments inside a batched prompt; distinctive enough that it
+    # will not appear in real paper text
+    BATCH_SEPARATOR = "\n<<<SEGMENT>>>\n"
+
+    def build_batch_prompt(self, texts: List[str]) -> str:
+        """
+        Build a prompt that corrects several text segments in one API call
+
+        Args:
+            texts: Text segments to correct together
+
+        Returns:
+            Formatted prompt with strict instructions and segment separators
+        """
+        prompt = f"""You are a grammar correction assistant. Your ONLY job is to fix grammar and spelling errors.
+
+The text below contains {len(texts)} segments separated by the marker <<<SEGMENT>>>.
+
+STRICT RULES:
+1. Do NOT remove any content
+2. Do NOT change the structure or order
+3. Do NOT summarize or rewrite
+4. Do NOT add new content
+5. ONLY fix grammar, spelling, and punctuation errors
+6. Keep every <<<SEGMENT>>> marker exactly where it is, so the output has the same number of segments
+
+Original text:
+{self.BATCH_SEPARATOR.join(texts)}
+
+Return ONLY the corrected text with no explanations."""
+
+        return prompt
+
+    def correct_texts(self, texts: List[str]) -> List[str]:
+        """
+        Correct several text segments with a single Gemini API call
+
+        One batched request replaces a network round-trip per segment. If the
+        response does not split back into the same number of segments, falls
+        back to correcting each segment individually.
+
+        Args:
+            texts: Text segments to correct
+
+        Returns:
+            List of corrected segments, same length and order as the input
+        """
+        if not self.enabled or not texts:
+            return list(texts)
+
+        try:
+            prompt = self.build_batch_prompt(texts)
+            response = self.model.generate_content(prompt)
+
+            if response and response.text:
+                corrected = [part.strip() for part in response.text.split("<<<SEGMENT>>>")]
+                if len(corrected) == len(texts):
+                    logger.debug(f"Successfully corrected {len(texts)} segments in one call")
+                    return corrected
+                logger.warning(
+                    f"Batched correction returned {len(corrected)} segments for "
+                    f"{len(texts)} inputs, correcting individually"
+                )
+            else:
+                logger.warning("Empty response from Gemini API, correcting individually")
+
+        except Exception as e:
+            logger.error(f"Error during batched grammar correction: {e}")
+            logger.info("Falling back to per-segment correction")
+
+        return [self.correct_text(text) for text in texts]
     
     def correct_text(self, text: str) -> str:
         """
@@ -118,22 +190,24 @@ Return ONLY the corrected text with no explanations."""
         if not self.enabled:
             logger.info("Grammar correction disabled, returning original sections")
             return sections
-        
-        corrected_sections = []
-        
-        for section in sections:
-            # Create a copy of the section
-            corrected_section = section.model_copy(deep=True)
-            
-            # Correct the content
+
+        corrected_sections = [section.model_copy(deep=True) for section in sections]
+
+        # Batch every non-empty content and heading into one API call instead
+        # of one round-trip per field; latency is bound by the single request
+        targets = []  # (section, attribute) pairs in batch order
+        texts = []
+
+        for section in corrected_sections:
             if section.content:
-                corrected_section.content = self.correct_text(section.content)
-            
-            # Correct the original heading if present
+                targets.append((section, "content"))
+                texts.append(section.content)
             if section.original_heading:
-                corrected_section.original_heading = self.correct_text(section.original_heading)
-            
-            corrected_sections.append(corrected_section)
-        
+                targets.append((section, "original_heading"))
+                texts.append(section.original_heading)
+
+        for (section, attribute), corrected_text in zip(targets, self.correct_texts(texts)):
+            setattr(section, attribute, corrected_text)
+
         logger.info(f"Corrected {len(corrected_sections)} sections")
         return corrected_sections
@@ -244,22 +244,32 @@ class IEEEFormatter:
         """
         # Make a copy of sections to avoid modifying original
         formatted_sections = []
-        
+
         for section in document.sections:
             # Apply font rules
             formatted_section = self.apply_font_rules(section)
             formatted_sections.append(formatted_section)
-        
+
         # Convert citations to IEEE numbered format
-        citation_converter = CitationConverter()
-        formatted_sections = citation_converter.convert_references(formatted_sections)
-        
+        # Without a References section the conversion is provably a no-op,
+        # so skip the citation scan stage entirely
+        has_references = any(
+            section.type is SectionType.REFERENCES for section in formatted_sections
+        )
+
+        if has_references:
+            citation_converter = CitationConverter()
+            formatted_sections = citation_converter.convert_references(formatted_sections)
+            citation_count = citation_converter.get_citation_count()
+        else:
+            citation_count = 0
+
         # Reorder sections to IEEE standard
         formatted_sections = self.reorder_sections(formatted_sections)
-        
+
         # Apply numbering to main sections
         formatted_sections = self.apply_numbering(formatted_sections)
-        
+
         # Create formatted document
         formatted_doc = FormattedDocument(
             sections=formatted_sections,
@@ -268,11 +278,11 @@ class IEEEFormatter:
                 "formatted": True,
                 "ieee_compliant": True,
                 "citations_converted": True,
-                "citation_count": citation_converter.get_citation_count()
+                "citation_count": citation_count
             },
             compliance_score=0.0  # Will be calculated by ComplianceScorer
         )
-        
+
         return formatted_doc
     
     def reorder_sections(self, sections: List[Section]) -> List[Section]:
@@ -2,6 +2,7 @@
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from enum import Enum
+from functools import cached_property
 
 
 class SectionType(str, Enum):
@@ -49,12 +50,30 @@ class ParsedDocument(BaseModel):
     sections: List[Section]
     metadata: Dict[str, Any]
 
+    @cached_property
+    def sections_by_type(self) -> Dict[SectionType, Section]:
+        """First section of each type, for O(1) lookup instead of a scan.
+        Computed on first access; don't reassign sections after using it."""
+        index: Dict[SectionType, Section] = {}
+        for section in self.sections:
+            index.setdefault(section.type, section)
+        return index
+
 
 class FormattedDocument(BaseModel):
     sections: List[Section]
     metadata: Dict[str, Any]
     compliance_score: float
 
+    @cached_property
+    def sections_by_type(self) -> Dict[SectionType, Section]:
+        """First section of each type, for O(1) lookup instead of a scan.
+        Computed on first access; don't reassign sections after using it."""
+        index: Dict[SectionType, Section] = {}
+        for section in self.sections:
+            index.setdefault(section.type, section)
+        return index
+
 
 class IssueSeverity(str, Enum):
     HIGH = "high"
@@ -0,0 +1,147 @@
+"""Shared fixtures for integration tests"""
+import os
+from functools import lru_cache
+
+import pytest
+
+# Sample papers used by the end-to-end tests
+EXP1_PATH = "uploads/Exp 1.docx"
+METEOR_PATH = "uploads/Meteor_Shower_Review_Wrong_Format_Exaggerated.docx"
+MANUSCRIPT_PATH = "uploads/formatted_manuscript (1).docx"
+
+KNOWN_PAPERS = (EXP1_PATH, METEOR_PATH, MANUSCRIPT_PATH)
+
+# One stat per known paper at collection; the skip guards below consult this
+# map instead of re-statting per test
+_AVAILABLE = {path: os.path.exists(path) for path in KNOWN_PAPERS}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stub_grammar_correction():
+    """Keep live Gemini calls out of the default integration run
+
+    The pipeline tests assert structure, not correction quality, so paying
+    real API latency (or tokenization work) per run buys nothing. Set
+    ENABLE_LIVE_LLM_TESTS=1 to exercise the real corrector.
+    """
+    if os.getenv("ENABLE_LIVE_LLM_TESTS"):
+        yield
+        return
+
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(
+        "app.corrector.GrammarCorrector.correct", lambda self, sections: sections
+    )
+    yield
+    monkeypatch.undo()
+
+
+@lru_cache(maxsize=None)
+def _parse_file(path, mtime):
+    """Parse a .docx at most once per (path, mtime); mtime keys out stale entries"""
+    from app.parser import DocumentParser
+
+    return DocumentParser().parse(path)
+
+
+def _parse_cached(path):
+    return _parse_file(path, os.path.getmtime(path))
+
+
+def _parse_or_skip(path):
+    """Parse a sample paper once, skipping dependent tests if it's absent"""
+    if not _AVAILABLE.get(path, False):
+        pytest.skip(f"Test file not found: {path}")
+
+    return _parse_cached(path)
+
+
+@pytest.fixture(scope="session")
+def formatter():
+    """Single IEEEFormatter shared by all integration tests in a session
+
+    rules.docx is read and parsed at most once per process; with pytest-xdist
+    each worker is its own process and builds its own instance on first use.
+    """
+    # Imported here so collection doesn't pay for app.formatter's transitive
+    # imports (python-docx) when these tests are filtered out
+    from app.formatter import IEEEFormatter
+
+    return IEEEFormatter("rules.docx")
+
+
+@pytest.fixture(scope="session")
+def parse_cached():
+    """The cached parse helper, for tests that walk uploads/ themselves"""
+    return _parse_cached
+
+
+@pytest.fixture(scope="session")
+def parsed_exp1():
+    """Exp 1.docx parsed once per session; copy before mutating"""
+    return _parse_or_skip(EXP1_PATH)
+
+
+@pytest.fixture(scope="session")
+def parsed_meteor():
+    """Wrong-format meteor shower paper parsed once per session"""
+    return _parse_or_skip(METEOR_PATH)
+
+
+@pytest.fixture(scope="session")
+def parsed_manuscript():
+    """formatted_manuscript (1).docx parsed once per session"""
+    return _parse_or_skip(MANUSCRIPT_PATH)
+
+
+@pytest.fixture(scope="session")
+def formatted_for(formatter):
+    """Memoized formatting, keyed by document identity
+
+    Same contract as issues_for: the parsed documents are session singletons
+    and never mutated, so each one is formatted at most once.
+    """
+    cache = {}
+
+    def _formatted(parsed_doc):
+        key = id(parsed_doc)
+        formatted_doc = cache.get(key)
+        if formatted_doc is None:
+            formatted_doc = cache[key] = formatter.format(parsed_doc)
+        return formatted_doc
+
+    return _formatted
+
+
+@pytest.fixture(scope="session")
+def formatted_exp1(formatted_for, parsed_exp1):
+    """Exp 1.docx formatted once per session"""
+    return formatted_for(parsed_exp1)
+
+
+@pytest.fixture(scope="session")
+def issues_for():
+    """Memoized issue detection, keyed by document identity
+
+    The parsed documents are session singletons and never mutated, so one
+    detector run per document serves every test that needs its issues.
+    """
+    from app.issue_detector import IssueDetector
+
+    detector = IssueDetector()
+    cache = {}
+
+    def _issues(parsed_doc):
+        key = id(parsed_doc)
+        issues = cache.get(key)
+        if issues is None:
+            issues = cache[key] = detector.detect_issues(parsed_doc)
+        return issues
+
+    return _issues
+
+
+@pytest.fixture(scope="session")
+def issues_exp1(parsed_exp1, issues_for):
+    """Issues detected on the parsed Exp 1.docx, computed once per session"""
+    return issues_for(parsed_exp1)
@@ -37,7 +37,7 @@ class TestChangeTrackingIntegration:
         )
         
         # Store original for comparison
-        document_before = parsed_doc.model_copy(deep=True)
+        document_before = ChangeTracker.snapshot(parsed_doc)
         
         # Format the document
         formatter = IEEEFormatter("rules.docx")
@@ -87,7 +87,7 @@ class TestChangeTrackingIntegration:
             metadata={"test": True}
         )
         
-        document_before = parsed_doc.model_copy(deep=True)
+        document_before = ChangeTracker.snapshot(parsed_doc)
         
         # Format (will reorder to IEEE standard)
         formatter = IEEEFormatter("rules.docx")
@@ -121,7 +121,7 @@ class TestChangeTrackingIntegration:
         parsed_doc = parser.parse(test_file_path)
         
         # Store original
-        document_before = parsed_doc.model_copy(deep=True)
+        document_before = ChangeTracker.snapshot(parsed_doc)
         
         # Format document
         formatter = IEEEFormatter("rules.docx")
@@ -178,7 +178,7 @@ class TestChangeTrackingIntegration:
             metadata={"test": True}
         )
         
-        document_before = parsed_doc.model_copy(deep=True)
+        document_before = ChangeTracker.snapshot(parsed_doc)
         
         # Format
         formatter = IEEEFormatter("rules.docx")
@@ -219,7 +219,7 @@ class TestChangeTrackingIntegration:
             metadata={"test": True}
         )
         
-        document_before = parsed_doc.model_copy(deep=True)
+        document_before = ChangeTracker.snapshot(parsed_doc)
         
         # Format
         formatter = IEEEFormatter("rules.docx")
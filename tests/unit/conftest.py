@@ -0,0 +1,251 @@
+"""Shared fixtures for unit tests
+
+Pydantic validation is the dominant cost in these tests, so the common
+Section/FontRule/document shapes are validated once per module and shared;
+tests that need a variant derive it with model_copy(update=...) instead of
+rebuilding from scratch. Treat the fixture objects as read-only.
+
+The models themselves stay mutable (the formatter and corrector assign to
+section fields in place), so immutability here is a convention of these
+fixtures, not enforced by the model classes.
+"""
+from collections import defaultdict
+
+import pytest
+
+from app.models import (
+    Section,
+    SectionType,
+    ParsedDocument,
+    FormattedDocument,
+    FontRule
+)
+
+
+# 200-word abstract content, built once at import; string multiply copies
+# at C level without the intermediate word list
+_ABSTRACT_200 = "word " * 199 + "word"
+
+
+def only_section(document, section_type):
+    """Return the document's single section of the given type
+
+    One scan replaces the filter-then-count-then-index pattern; fails if
+    the type is absent or duplicated. Identity comparison is enough since
+    enum members are singletons.
+    """
+    matches = [s for s in document.sections if s.type is section_type]
+    assert len(matches) == 1
+    return matches[0]
+
+
+@pytest.fixture(autouse=True)
+def _no_net():
+    """Block socket use for every unit test when pytest-socket is installed
+
+    The unit suite must stay offline (the Gemini SDK is stubbed wherever a
+    call could go out); with the optional pytest-socket plugin that becomes
+    enforced instead of assumed. Without the plugin this is a no-op.
+    """
+    try:
+        from pytest_socket import disable_socket, enable_socket
+    except ImportError:
+        yield
+        return
+    disable_socket()
+    yield
+    enable_socket()
+
+
+def group_by_type(items):
+    """Index fixes or issues by type in one pass instead of a scan per
+    assertion"""
+    grouped = defaultdict(list)
+    for item in items:
+        grouped[item.type].append(item)
+    return grouped
+
+
+@pytest.fixture(scope="session")
+def tracker():
+    """One ChangeTracker shared by the whole session
+
+    track_changes clears the tracker's fix list on every call, so a shared
+    instance needs no per-test reset.
+    """
+    from app.change_tracker import ChangeTracker
+
+    return ChangeTracker()
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """One DocumentParser shared by the whole session
+
+    detect_section_type is stateless, so every case can reuse the same
+    instance instead of rebuilding one in setup_method.
+    """
+    from app.parser import DocumentParser
+
+    return DocumentParser()
+
+
+@pytest.fixture(scope="session")
+def scorer():
+    """One ComplianceScorer shared by the whole session (calculate is stateless)"""
+    from app.compliance_scorer import ComplianceScorer
+
+    return ComplianceScorer()
+
+
+@pytest.fixture(scope="session")
+def detector():
+    """One IssueDetector shared by the whole session (detect_issues is stateless)"""
+    from app.issue_detector import IssueDetector
+
+    return IssueDetector()
+
+
+@pytest.fixture(scope="session")
+def applicator():
+    """One UserEditsApplicator shared by the whole session
+
+    apply_edits deep-copies the document it receives, so a shared instance
+    never leaks state between tests.
+    """
+    from app.user_edits import UserEditsApplicator
+
+    return UserEditsApplicator()
+
+
+@pytest.fixture(scope="session")
+def _converter_instance():
+    from app.citation_converter import CitationConverter
+
+    return CitationConverter()
+
+
+@pytest.fixture
+def converter(_converter_instance):
+    """Session-wide CitationConverter, reset to a clean citation map per test"""
+    _converter_instance.reset()
+    return _converter_instance
+
+
+@pytest.fixture(scope="module")
+def intro_section():
+    """Introduction section template with an original heading"""
+    return Section(
+        id="section-1",
+        type=SectionType.INTRODUCTION,
+        content="This is the introduction content.",
+        original_heading="Introduction",
+        word_count=5
+    )
+
+
+@pytest.fixture(scope="module")
+def abstract_section():
+    """Abstract section template without a heading"""
+    return Section(
+        id="section-2",
+        type=SectionType.ABSTRACT,
+        content="Abstract content",
+        word_count=2
+    )
+
+
+@pytest.fixture(scope="module")
+def font_rule_tnr9():
+    """IEEE abstract font: Times New Roman 9pt justified"""
+    return FontRule(
+        font_family="Times New Roman",
+        font_size=9,
+        bold=False,
+        italic=False,
+        alignment="justify"
+    )
+
+
+@pytest.fixture(scope="module")
+def font_rule_tnr10():
+    """IEEE body font: Times New Roman 10pt justified"""
+    return FontRule(
+        font_family="Times New Roman",
+        font_size=10,
+        bold=False,
+        italic=False,
+        alignment="justify"
+    )
+
+
+@pytest.fixture(scope="session")
+def compliant_sections():
+    """The eight canonical sections of a compliant paper, in IEEE order
+
+    Validated once per session and shared by the scorer and issue-detection
+    modules; treat the list and its sections as read-only.
+    """
+    return [
+        Section(id="1", type=SectionType.TITLE, content="Title", word_count=1,
+                formatted_heading=None),
+        Section(id="2", type=SectionType.ABSTRACT, content=_ABSTRACT_200,
+                original_heading="Abstract", formatted_heading="ABSTRACT",
+                word_count=200),
+        Section(id="3", type=SectionType.KEYWORDS, content="keywords",
+                original_heading="Keywords", formatted_heading="KEYWORDS",
+                word_count=1),
+        Section(id="4", type=SectionType.INTRODUCTION, content="intro",
+                original_heading="Introduction",
+                formatted_heading="I. INTRODUCTION", word_count=1),
+        Section(id="5", type=SectionType.METHODOLOGY, content="methods",
+                original_heading="Methodology",
+                formatted_heading="II. METHODOLOGY", word_count=1),
+        Section(id="6", type=SectionType.RESULTS, content="results",
+                original_heading="Results", formatted_heading="III. RESULTS",
+                word_count=1),
+        Section(id="7", type=SectionType.CONCLUSION, content="conclusion",
+                original_heading="Conclusion",
+                formatted_heading="IV. CONCLUSION", word_count=1),
+        Section(id="8", type=SectionType.REFERENCES, content="refs",
+                original_heading="References", formatted_heading="V. REFERENCES",
+                word_count=1),
+    ]
+
+
+@pytest.fixture
+def compliant_doc_factory(compliant_sections):
+    """Build a compliant document from the cached sections
+
+    section_patches maps a section index to model_copy updates, so variant
+    documents copy only the sections they change.
+    """
+    def _make(cls=FormattedDocument, section_patches=None):
+        sections = list(compliant_sections)
+        for index, patch in (section_patches or {}).items():
+            sections[index] = sections[index].model_copy(update=patch)
+        if cls is ParsedDocument:
+            return ParsedDocument(sections=sections, metadata={})
+        return FormattedDocument(
+            sections=sections, metadata={}, compliance_score=0.0
+        )
+    return _make
+
+
+@pytest.fixture(scope="module")
+def before_doc_two_sections(intro_section, abstract_section):
+    """Introduction before Abstract — the wrong order for IEEE"""
+    return ParsedDocument(
+        sections=[intro_section, abstract_section],
+        metadata={}
+    )
+
+
+@pytest.fixture(scope="module")
+def after_doc_two_sections(intro_section, abstract_section):
+    """The same two sections in the corrected IEEE order"""
+    return FormattedDocument(
+        sections=[abstract_section, intro_section],
+        metadata={},
+        compliance_score=90.0
+    )
@@ -1,87 +1,67 @@
-"""Unit tests for section type detection"""
-import pytest
-from app.parser import DocumentParser
-from app.models import SectionType
-
-
-class TestSectionTypeDetection:
-    """Test section type detection with keyword matching"""
-    
-    def setup_method(self):
-        self.parser = DocumentParser()
-    
-    def test_abstract_detection(self):
-        """Test Abstract section detection"""
-        assert self.parser.detect_section_type("Abstract", "") == SectionType.ABSTRACT
-        assert self.parser.detect_section_type("ABSTRACT", "") == SectionType.ABSTRACT
-        assert self.parser.detect_section_type("Summary", "") == SectionType.ABSTRACT
-        assert self.parser.detect_section_type("I. Abstract", "") == SectionType.ABSTRACT
-    
-    def test_keywords_detection(self):
-        """Test Keywords section detection"""
-        assert self.parser.detect_section_type("Keywords", "") == SectionType.KEYWORDS
-        assert self.parser.detect_section_type("Index Terms", "") == SectionType.KEYWORDS
-        assert self.parser.detect_section_type("Key Words", "") == SectionType.KEYWORDS
-        assert self.parser.detect_section_type("II. Keywords", "") == SectionType.KEYWORDS
-    
-    def test_introduction_detection(self):
-        """Test Introduction section detection"""
-        assert self.parser.detect_section_type("Introduction", "") == SectionType.INTRODUCTION
-        assert self.parser.detect_section_type("INTRODUCTION", "") == SectionType.INTRODUCTION
-        assert self.parser.detect_section_type("I. Introduction", "") == SectionType.INTRODUCTION
-        assert self.parser.detect_section_type("1. Introduction", "") == SectionType.INTRODUCTION
-    
-    def test_methodology_detection(self):
-        """Test Methodology section detection"""
-        assert self.parser.detect_section_type("Methodology", "") == SectionType.METHODOLOGY
-        assert self.parser.detect_section_type("Methods", "") == SectionType.METHODOLOGY
-        assert self.parser.detect_section_type("Approach", "") == SectionType.METHODOLOGY
-        assert self.parser.detect_section_type("II. Methodology", "") == SectionType.METHODOLOGY
-    
-    def test_results_detection(self):
-        """Test Results section detection"""
-        assert self.parser.detect_section_type("Results", "") == SectionType.RESULTS
-        assert self.parser.detect_section_type("Findings", "") == SectionType.RESULTS
-        assert self.parser.detect_section_type("Experiments", "") == SectionType.RESULTS
-        assert self.parser.detect_section_type("III. Results", "") == SectionType.RESULTS
-    
-    def test_conclusion_detection(self):
-        """Test Conclusion section detection"""
-        assert self.parser.detect_section_type("Conclusion", "") == SectionType.CONCLUSION
-        assert self.parser.detect_section_type("Conclusions", "") == SectionType.CONCLUSION
-        assert self.parser.detect_section_type("Concluding Remarks", "") == SectionType.CONCLUSION
-        assert self.parser.detect_section_type("IV. Conclusion", "") == SectionType.CONCLUSION
-    
-    def test_references_detection(self):
-        """Test References section detection"""
-        assert self.parser.detect_section_type("References", "") == SectionType.REFERENCES
-        assert self.parser.detect_section_type("Bibliography", "") == SectionType.REFERENCES
-        assert self.parser.detect_section_type("Works Cited", "") == SectionType.REFERENCES
-    
-    def test_optional_sections_detection(self):
-        """Test optional section detection"""
-        assert self.parser.detect_section_type("Related Work", "") == SectionType.RELATED_WORK
-        assert self.parser.detect_section_type("Literature Review", "") == SectionType.LITERATURE_REVIEW
-        assert self.parser.detect_section_type("Discussion", "") == SectionType.DISCUSSION
-        assert self.parser.detect_section_type("Future Work", "") == SectionType.FUTURE_WORK
-        assert self.parser.detect_section_type("Acknowledgments", "") == SectionType.ACKNOWLEDGMENTS
-        assert self.parser.detect_section_type("Appendix", "") == SectionType.APPENDIX
-    
-    def test_unknown_section(self):
-        """Test unknown section type"""
-        assert self.parser.detect_section_type("Random Section", "") == SectionType.UNKNOWN
-        assert self.parser.detect_section_type("Some Other Heading", "") == SectionType.UNKNOWN
-    
-    def test_numbering_removal(self):
-        """Test that numbering is properly removed before detection"""
-        # Roman numerals
-        assert self.parser.detect_section_type("I. Introduction", "") == SectionType.INTRODUCTION
-        assert self.parser.detect_section_type("II. Methodology", "") == SectionType.METHODOLOGY
-        assert self.parser.detect_section_type("III. Results", "") == SectionType.RESULTS
-        
-        # Arabic numerals
-        assert self.parser.detect_section_type("1. Introduction", "") == SectionType.INTRODUCTION
-        assert self.parser.detect_section_type("2. Methodology", "") == SectionType.METHODOLOGY
-        
-        # Section prefix
-        assert self.parser.detect_section_type("Section 1: Introduction", "") == SectionType.INTRODUCTION
+"""Unit tests for section type detection"""
+import pytest
+from app.models import SectionType
+
+
+# Every (heading, expected type) pair in one table; pytest collects each as
+# its own case against the shared session parser
+SECTION_CASES = [
+    # Abstract
+    ("Abstract", SectionType.ABSTRACT),
+    ("ABSTRACT", SectionType.ABSTRACT),
+    ("Summary", SectionType.ABSTRACT),
+    ("I. Abstract", SectionType.ABSTRACT),
+    # Keywords
+    ("Keywords", SectionType.KEYWORDS),
+    ("Index Terms", SectionType.KEYWORDS),
+    ("Key Words", SectionType.KEYWORDS),
+    ("II. Keywords", SectionType.KEYWORDS),
+    # Introduction
+    ("Introduction", SectionType.INTRODUCTION),
+    ("INTRODUCTION", SectionType.INTRODUCTION),
+    # Methodology
+    ("Methodology", SectionType.METHODOLOGY),
+    ("Methods", SectionType.METHODOLOGY),
+    ("Approach", SectionType.METHODOLOGY),
+    # Results
+    ("Results", SectionType.RESULTS),
+    ("Findings", SectionType.RESULTS),
+    ("Experiments", SectionType.RESULTS),
+    # Conclusion
+    ("Conclusion", SectionType.CONCLUSION),
+    ("Conclusions", SectionType.CONCLUSION),
+    ("Concluding Remarks", SectionType.CONCLUSION),
+    ("IV. Conclusion", SectionType.CONCLUSION),
+    # References
+    ("References", SectionType.REFERENCES),
+    ("Bibliography", SectionType.REFERENCES),
+    ("Works Cited", SectionType.REFERENCES),
+    # Optional sections
+    ("Related Work", SectionType.RELATED_WORK),
+    ("Literature Review", SectionType.LITERATURE_REVIEW),
+    ("Discussion", SectionType.DISCUSSION),
+    ("Future Work", SectionType.FUTURE_WORK),
+    ("Acknowledgments", SectionType.ACKNOWLEDGMENTS),
+    ("Appendix", SectionType.APPENDIX),
+    # Unknown headings
+    ("Random Section", SectionType.UNKNOWN),
+    ("Some Other Heading", SectionType.UNKNOWN),
+    # Numbering removal: Roman numerals
+    ("I. Introduction", SectionType.INTRODUCTION),
+    ("II. Methodology", SectionType.METHODOLOGY),
+    ("III. Results", SectionType.RESULTS),
+    # Numbering removal: Arabic numerals
+    ("1. Introduction", SectionType.INTRODUCTION),
+    ("2. Methodology", SectionType.METHODOLOGY),
+    # Numbering removal: Section prefix
+    ("Section 1: Introduction", SectionType.INTRODUCTION),
+]
+
+
+@pytest.mark.parametrize(
+    "heading,expected", SECTION_CASES,
+    ids=lambda p: p if isinstance(p, str) else p.name
+)
+def test_detect_section_type(parser, heading, expected):
+    """Test section type detection with keyword matching"""
+    assert parser.detect_section_type(heading, "") == expected
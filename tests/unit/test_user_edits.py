@@ -1,258 +1,309 @@
-"""Unit tests for user edits application"""
-import pytest
-from app.user_edits import UserEditsApplicator
-from app.models import (
-    UserEdits,
-    ParsedDocument,
-    Section,
-    SectionType,
-    IssueSeverity
-)
-import uuid
-
-
-def create_test_section(section_type: SectionType, content: str = "Test content") -> Section:
-    """Helper to create a test section"""
-    return Section(
-        id=str(uuid.uuid4()),
-        type=section_type,
-        content=content,
-        original_heading=section_type.value,
-        word_count=len(content.split())
-    )
-
-
-def test_apply_author_info_to_existing_section():
-    """Test applying author info when AUTHORS section already exists"""
-    # Create document with existing AUTHORS section
-    sections = [
-        create_test_section(SectionType.TITLE, "Test Paper"),
-        create_test_section(SectionType.AUTHORS, "Old Author"),
-        create_test_section(SectionType.ABSTRACT, "Abstract content")
-    ]
-    document = ParsedDocument(sections=sections, metadata={})
-    
-    # Create edits with new author info
-    edits = UserEdits(
-        author_name="John Doe",
-        author_email="john@example.com"
-    )
-    
-    # Apply edits
-    applicator = UserEditsApplicator()
-    updated_doc = applicator.apply_edits(document, edits)
-    
-    # Verify author section was updated
-    authors_sections = [s for s in updated_doc.sections if s.type == SectionType.AUTHORS]
-    assert len(authors_sections) == 1
-    assert "John Doe" in authors_sections[0].content
-    assert "john@example.com" in authors_sections[0].content
-
-
-def test_apply_author_info_creates_new_section():
-    """Test applying author info when no AUTHORS section exists"""
-    # Create document without AUTHORS section
-    sections = [
-        create_test_section(SectionType.TITLE, "Test Paper"),
-        create_test_section(SectionType.ABSTRACT, "Abstract content")
-    ]
-    document = ParsedDocument(sections=sections, metadata={})
-    
-    # Create edits with author info
-    edits = UserEdits(author_name="Jane Smith")
-    
-    # Apply edits
-    applicator = UserEditsApplicator()
-    updated_doc = applicator.apply_edits(document, edits)
-    
-    # Verify new AUTHORS section was created
-    authors_sections = [s for s in updated_doc.sections if s.type == SectionType.AUTHORS]
-    assert len(authors_sections) == 1
-    assert "Jane Smith" in authors_sections[0].content
-    
-    # Verify it was inserted after TITLE
-    title_idx = next(i for i, s in enumerate(updated_doc.sections) if s.type == SectionType.TITLE)
-    authors_idx = next(i for i, s in enumerate(updated_doc.sections) if s.type == SectionType.AUTHORS)
-    assert authors_idx == title_idx + 1
-
-
-def test_apply_affiliation():
-    """Test applying affiliation information"""
-    sections = [
-        create_test_section(SectionType.TITLE, "Test Paper"),
-        create_test_section(SectionType.AUTHORS, "John Doe")
-    ]
-    document = ParsedDocument(sections=sections, metadata={})
-    
-    edits = UserEdits(affiliation="MIT Computer Science Department")
-    
-    applicator = UserEditsApplicator()
-    updated_doc = applicator.apply_edits(document, edits)
-    
-    # Verify AFFILIATION section was created
-    affiliation_sections = [s for s in updated_doc.sections if s.type == SectionType.AFFILIATION]
-    assert len(affiliation_sections) == 1
-    assert "MIT Computer Science Department" in affiliation_sections[0].content
-
-
-def test_apply_keywords():
-    """Test applying keywords"""
-    sections = [
-        create_test_section(SectionType.TITLE, "Test Paper"),
-        create_test_section(SectionType.ABSTRACT, "Abstract content")
-    ]
-    document = ParsedDocument(sections=sections, metadata={})
-    
-    edits = UserEdits(keywords=["machine learning", "neural networks", "AI"])
-    
-    applicator = UserEditsApplicator()
-    updated_doc = applicator.apply_edits(document, edits)
-    
-    # Verify KEYWORDS section was created
-    keywords_sections = [s for s in updated_doc.sections if s.type == SectionType.KEYWORDS]
-    assert len(keywords_sections) == 1
-    assert "machine learning" in keywords_sections[0].content
-    assert "neural networks" in keywords_sections[0].content
-    assert "AI" in keywords_sections[0].content
-
-
-def test_apply_section_corrections():
-    """Test correcting section types"""
-    section_id = str(uuid.uuid4())
-    sections = [
-        Section(
-            id=section_id,
-            type=SectionType.UNKNOWN,
-            content="This is actually the methodology",
-            original_heading="Methods",
-            word_count=5
-        )
-    ]
-    document = ParsedDocument(sections=sections, metadata={})
-    
-    # Correct the section type
-    edits = UserEdits(
-        section_corrections={section_id: SectionType.METHODOLOGY}
-    )
-    
-    applicator = UserEditsApplicator()
-    updated_doc = applicator.apply_edits(document, edits)
-    
-    # Verify section type was corrected
-    corrected_section = next(s for s in updated_doc.sections if s.id == section_id)
-    assert corrected_section.type == SectionType.METHODOLOGY
-
-
-def test_no_auto_generation_by_default():
-    """Test that auto-generation is disabled by default"""
-    sections = [create_test_section(SectionType.TITLE, "Test Paper")]
-    document = ParsedDocument(sections=sections, metadata={})
-    
-    # Apply empty edits
-    edits = UserEdits()
-    
-    applicator = UserEditsApplicator()
-    updated_doc = applicator.apply_edits(document, edits)
-    
-    # Verify no new sections were auto-generated
-    assert len(updated_doc.sections) == len(document.sections)
-    assert updated_doc.metadata["auto_generation_allowed"] is False
-
-
-def test_check_missing_sections_without_generation():
-    """Test that missing sections are flagged but not auto-generated"""
-    # Create document missing several required sections
-    sections = [
-        create_test_section(SectionType.TITLE, "Test Paper"),
-        create_test_section(SectionType.INTRODUCTION, "Intro content")
-    ]
-    document = ParsedDocument(sections=sections, metadata={})
-    
-    applicator = UserEditsApplicator()
-    issues, missing_sections = applicator.check_missing_sections_without_generation(document)
-    
-    # Verify issues were created for missing sections
-    assert len(issues) > 0
-    
-    # Verify expected missing sections are flagged
-    missing_types = {issue.section for issue in issues}
-    assert "Abstract" in missing_types
-    assert "Keywords" in missing_types
-    assert "Methodology" in missing_types
-    assert "Results" in missing_types
-    assert "Conclusion" in missing_types
-    assert "References" in missing_types
-    
-    # Verify all issues are high severity
-    for issue in issues:
-        assert issue.severity == IssueSeverity.HIGH
-        assert "missing" in issue.message.lower()
-        assert "manually" in issue.message.lower()
-
-
-def test_multiple_edits_applied_together():
-    """Test applying multiple types of edits at once"""
-    section_id = str(uuid.uuid4())
-    sections = [
-        create_test_section(SectionType.TITLE, "Test Paper"),
-        Section(
-            id=section_id,
-            type=SectionType.UNKNOWN,
-            content="Abstract content",
-            original_heading="Summary",
-            word_count=2
-        )
-    ]
-    document = ParsedDocument(sections=sections, metadata={})
-    
-    # Apply multiple edits
-    edits = UserEdits(
-        author_name="Alice Johnson",
-        affiliation="Stanford University",
-        keywords=["research", "testing"],
-        section_corrections={section_id: SectionType.ABSTRACT}
-    )
-    
-    applicator = UserEditsApplicator()
-    updated_doc = applicator.apply_edits(document, edits)
-    
-    # Verify all edits were applied
-    assert any(s.type == SectionType.AUTHORS for s in updated_doc.sections)
-    assert any(s.type == SectionType.AFFILIATION for s in updated_doc.sections)
-    assert any(s.type == SectionType.KEYWORDS for s in updated_doc.sections)
-    
-    # Verify section correction was applied
-    corrected_section = next(s for s in updated_doc.sections if s.id == section_id)
-    assert corrected_section.type == SectionType.ABSTRACT
-    
-    # Verify metadata
-    assert updated_doc.metadata["user_edits_applied"] is True
-    edits_summary = updated_doc.metadata["edits_summary"]
-    assert edits_summary["author_info_applied"] is True
-    assert edits_summary["affiliation_applied"] is True
-    assert edits_summary["keywords_applied"] is True
-    assert edits_summary["section_corrections_applied"] is True
-
-
-def test_edits_do_not_modify_original_document():
-    """Test that applying edits doesn't modify the original document"""
-    sections = [create_test_section(SectionType.TITLE, "Test Paper")]
-    document = ParsedDocument(sections=sections, metadata={})
-    
-    original_section_count = len(document.sections)
-    
-    edits = UserEdits(author_name="Test Author")
-    
-    applicator = UserEditsApplicator()
-    updated_doc = applicator.apply_edits(document, edits)
-    
-    # Verify original document is unchanged
-    assert len(document.sections) == original_section_count
-    assert not any(s.type == SectionType.AUTHORS for s in document.sections)
-    
-    # Verify updated document has the changes
-    assert any(s.type == SectionType.AUTHORS for s in updated_doc.sections)
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+"""Unit tests for user edits application
+
+Every test builds its own document and edits and apply_edits returns a
+copy, so the module has no shared mutable state and shards cleanly under
+pytest-xdist (see pytest.ini for the optional -n auto invocation).
+"""
+import pytest
+from tests.unit.conftest import only_section
+from app.change_tracker import ChangeTracker
+from app.models import (
+    UserEdits,
+    ParsedDocument,
+    Section,
+    SectionType,
+    IssueSeverity
+)
+import itertools
+from functools import lru_cache
+
+# With pytest-xdist's --dist loadgroup, keep this module on one worker so
+# the session applicator and memoized templates are built only once
+pytestmark = pytest.mark.xdist_group("user_edits")
+
+# Local aliases for members used inside comprehension predicates, where
+# SectionType.X would re-run a global plus attribute lookup per section
+_TITLE = SectionType.TITLE
+_AUTHORS = SectionType.AUTHORS
+_ABSTRACT = SectionType.ABSTRACT
+_AFFILIATION = SectionType.AFFILIATION
+_KEYWORDS = SectionType.KEYWORDS
+
+# Monotonic ids are unique enough for tests and skip uuid4's urandom call
+# and hex formatting per section
+_ids = itertools.count(1)
+
+
+def _next_id() -> str:
+    return f"sec-{next(_ids)}"
+
+
+# Shared empty-metadata sentinel: apply_edits deep-copies the document
+# before writing metadata, so one dict can back every input document
+_EMPTY_META = {}
+
+# Sections the applicator must flag when absent
+_REQUIRED_MISSING = frozenset({
+    "Abstract", "Keywords", "Methodology", "Results", "Conclusion", "References"
+})
+
+
+def create_test_section(section_type: SectionType, content: str = "Test content") -> Section:
+    """Helper to create a test section
+
+    Pydantic models take keyword arguments only, so the positional fast
+    path isn't available; model_construct skips validation instead, which
+    is safe because every field here is already the right type.
+    """
+    return Section.model_construct(
+        id=_next_id(),
+        type=section_type,
+        content=content,
+        original_heading=section_type.value,
+        # Count separators instead of materializing the word list; test
+        # contents are single-space separated
+        word_count=content.count(" ") + 1 if content else 0
+    )
+
+
+@lru_cache(maxsize=None)
+def _edits(author_name=None, author_email=None, affiliation=None, keywords=()):
+    """Memoized UserEdits for the common field combinations
+
+    Sharing is safe because apply_edits reads the edits without mutating
+    them, which the immutability test asserts. Edits carrying
+    section_corrections are built inline since dicts aren't hashable.
+    """
+    return UserEdits(
+        author_name=author_name,
+        author_email=author_email,
+        affiliation=affiliation,
+        keywords=list(keywords) if keywords else None
+    )
+
+
+@lru_cache(maxsize=None)
+def _template(*section_types):
+    """Memoized read-only document for a given section-type layout
+
+    apply_edits deep-copies its input (asserted by
+    test_edits_do_not_modify_original_document), so tests can share the
+    cached instance instead of rebuilding sections and document per call.
+    """
+    return ParsedDocument(
+        sections=[create_test_section(t) for t in section_types],
+        metadata=_EMPTY_META
+    )
+
+
+# The author/affiliation/keywords tests shared the same build-apply-assert
+# skeleton; each row gives the starting section types, the edit, and the
+# section type plus content substrings expected afterwards
+_APPLY_CASES = [
+    pytest.param(
+        (SectionType.TITLE, SectionType.AUTHORS, SectionType.ABSTRACT),
+        _edits(author_name="John Doe", author_email="john@example.com"),
+        SectionType.AUTHORS, ("John Doe", "john@example.com"),
+        id="author_info_updates_existing"),
+    pytest.param(
+        (SectionType.TITLE, SectionType.AUTHORS),
+        _edits(affiliation="MIT Computer Science Department"),
+        SectionType.AFFILIATION, ("MIT Computer Science Department",),
+        id="affiliation_creates_section"),
+    pytest.param(
+        (SectionType.TITLE, SectionType.ABSTRACT),
+        _edits(keywords=("machine learning", "neural networks", "AI")),
+        SectionType.KEYWORDS, ("machine learning", "neural networks", "AI"),
+        id="keywords_create_section"),
+]
+
+
+@pytest.mark.parametrize("section_types,edits,expected_type,needles", _APPLY_CASES)
+def test_apply_edit_fills_section(applicator, section_types, edits, expected_type, needles):
+    """Test that applying an edit updates or creates the right section"""
+    document = _template(*section_types)
+    
+    updated_doc = applicator.apply_edits(document, edits)
+    
+    # Exactly one section of the expected type, carrying the edit content;
+    # bind the content once and check every needle in a single pass
+    content = only_section(updated_doc, expected_type).content
+    assert all(needle in content for needle in needles)
+
+
+def test_apply_author_info_creates_new_section(applicator):
+    """Test applying author info when no AUTHORS section exists"""
+    # Document without an AUTHORS section
+    document = _template(SectionType.TITLE, SectionType.ABSTRACT)
+    
+    # Create edits with author info
+    edits = _edits(author_name="Jane Smith")
+    
+    # Apply edits
+    updated_doc = applicator.apply_edits(document, edits)
+    
+    # Verify new AUTHORS section was created
+    assert "Jane Smith" in only_section(updated_doc, SectionType.AUTHORS).content
+    
+    # Verify it was inserted after TITLE; one projection of the types,
+    # then C-level list.index lookups
+    types = [s.type for s in updated_doc.sections]
+    assert types.index(_AUTHORS) == types.index(_TITLE) + 1
+
+
+def test_apply_section_corrections(applicator):
+    """Test correcting section types"""
+    section_id = _next_id()
+    sections = [
+        Section(
+            id=section_id,
+            type=SectionType.UNKNOWN,
+            content="This is actually the methodology",
+            original_heading="Methods",
+            word_count=5
+        )
+    ]
+    document = ParsedDocument(sections=sections, metadata=_EMPTY_META)
+    
+    # Correct the section type
+    edits = UserEdits(
+        section_corrections={section_id: SectionType.METHODOLOGY}
+    )
+    
+    updated_doc = applicator.apply_edits(document, edits)
+    
+    # Verify section type was corrected
+    corrected_section = next(s for s in updated_doc.sections if s.id == section_id)
+    assert corrected_section.type is SectionType.METHODOLOGY
+
+
+def test_no_auto_generation_by_default(applicator):
+    """Test that auto-generation is disabled by default"""
+    document = _template(SectionType.TITLE)
+    
+    # Apply empty edits
+    edits = _edits()
+    
+    updated_doc = applicator.apply_edits(document, edits)
+    
+    # Verify no new sections were auto-generated
+    assert len(updated_doc.sections) == len(document.sections)
+    assert updated_doc.metadata["auto_generation_allowed"] is False
+
+
+def test_check_missing_sections_without_generation(applicator):
+    """Test that missing sections are flagged but not auto-generated"""
+    # Document missing several required sections
+    document = _template(SectionType.TITLE, SectionType.INTRODUCTION)
+    
+    issues, missing_sections = applicator.check_missing_sections_without_generation(document)
+    
+    # Verify issues were created for missing sections
+    assert len(issues) > 0
+    
+    # Verify expected missing sections are flagged, in one subset check
+    missing_types = {issue.section for issue in issues}
+    assert _REQUIRED_MISSING <= missing_types
+    
+    # Verify all issues are high severity and tell the user to act manually
+    assert all(issue.severity is IssueSeverity.HIGH for issue in issues)
+    assert all(
+        "missing" in issue.message.lower() and "manually" in issue.message.lower()
+        for issue in issues
+    )
+
+
+_COMBINED_SECTION_ID = "combined-unknown"
+
+
+@pytest.fixture(scope="module")
+def combined_result(applicator):
+    """apply_edits run once for the combined author, affiliation, keywords
+    and section-correction edit; the parametrized checks share the result"""
+    document = ParsedDocument(
+        sections=[
+            create_test_section(SectionType.TITLE, "Test Paper"),
+            Section(
+                id=_COMBINED_SECTION_ID,
+                type=SectionType.UNKNOWN,
+                content="Abstract content",
+                original_heading="Summary",
+                word_count=2
+            )
+        ],
+        metadata=_EMPTY_META
+    )
+    edits = UserEdits(
+        author_name="Alice Johnson",
+        affiliation="Stanford University",
+        # A tuple is enough here; validation coerces it to the model's list
+        keywords=("research", "testing"),
+        section_corrections={_COMBINED_SECTION_ID: SectionType.ABSTRACT}
+    )
+    return applicator.apply_edits(document, edits)
+
+
+def _check_sections_added(doc):
+    # One pass over the sections, then set-membership checks
+    types = {s.type for s in doc.sections}
+    assert _AUTHORS in types
+    assert _AFFILIATION in types
+    assert _KEYWORDS in types
+
+
+def _check_correction(doc):
+    corrected_section = next(s for s in doc.sections if s.id == _COMBINED_SECTION_ID)
+    assert corrected_section.type is SectionType.ABSTRACT
+
+
+def _check_metadata(doc):
+    assert doc.metadata["user_edits_applied"] is True
+    # One dict comparison instead of a flag-by-flag chain; on failure
+    # pytest's dict diff names exactly the flags that are off
+    edits_summary = doc.metadata["edits_summary"]
+    expected = {
+        "author_info_applied": True,
+        "affiliation_applied": True,
+        "keywords_applied": True,
+        "section_corrections_applied": True,
+    }
+    assert {key: edits_summary[key] for key in expected} == expected
+
+
+@pytest.mark.parametrize("check", [
+    pytest.param(_check_sections_added, id="sections_added"),
+    pytest.param(_check_correction, id="correction_applied"),
+    pytest.param(_check_metadata, id="metadata_recorded"),
+])
+def test_multiple_edits_applied_together(combined_result, check):
+    """Test applying multiple types of edits at once"""
+    check(combined_result)
+
+
+def test_edits_do_not_modify_original_document(applicator):
+    """Test that applying edits doesn't modify the original document"""
+    document = _template(SectionType.TITLE)
+    
+    # Structural fingerprint of the original, reusing the tracker's
+    # lightweight snapshot; one tuple comparison catches added, removed
+    # or retyped sections and content changes alike
+    before = ChangeTracker.snapshot(document)
+    
+    edits = _edits(author_name="Test Author")
+    edits_before = edits.model_dump()
+    
+    updated_doc = applicator.apply_edits(document, edits)
+    
+    # Verify original document is unchanged
+    assert ChangeTracker.snapshot(document) == before
+    
+    # Verify the edits object is read, not mutated — the contract that
+    # makes the memoized _edits instances safe to share
+    assert edits.model_dump() == edits_before
+    
+    # Verify updated document has the changes
+    assert any(s.type is _AUTHORS for s in updated_doc.sections)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])